@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+'''
+    Throughput benchmark in games per minute.
+    Plays small synthetic games, either with a fresh interpreter per game (like start.sh)
+    or through the shim against one warm server (server.py).
+
+        python3 bench.py --mode process --games 20 --parallel 4
+        python3 bench.py --mode server --games 20 --parallel 4
+'''
+import argparse
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MOVES = {'N':(0,-1),'S':(0,1),'W':(-1,0),'E':(1,0)}
+
+class synthetic_game:
+    '''
+        Minimal stand in for the runner: walled border, random walls, random gems, the bot moves by the answers
+    '''
+    def __init__(__self__,seed:int,width:int=20,height:int=12,max_ticks:int=100,vis_radius:int=4,gem_ttl:int=30):
+        __self__.rng = random.Random(seed)
+        __self__.width = width
+        __self__.height = height
+        __self__.max_ticks = max_ticks
+        __self__.vis_radius = vis_radius
+        __self__.gem_ttl = gem_ttl
+        __self__.walls = {(__self__.rng.randrange(width),__self__.rng.randrange(height)) for _ in range(width*height//8)}
+        __self__.walls.update({(x,y) for x in range(width) for y in range(height) if x in (0,width-1) or y in (0,height-1)})
+        __self__.bot = __self__.__free_field()
+        __self__.gems = dict()
+        __self__.tick = 0
+        __self__.score = 0
+    def __free_field(__self__)->tuple[int,int]:
+        while True:
+            pos = (__self__.rng.randrange(__self__.width),__self__.rng.randrange(__self__.height))
+            if pos not in __self__.walls:
+                return pos
+    def __visible(__self__)->list[tuple[int,int]]:
+        x0,y0 = __self__.bot
+        r = __self__.vis_radius
+        return [(x,y) for x in range(max(0,x0-r),min(__self__.width,x0+r+1))
+                      for y in range(max(0,y0-r),min(__self__.height,y0+r+1))
+                      if (x-x0)**2 + (y-y0)**2 <= r**2]
+    def state(__self__)->str:
+        visible = __self__.__visible()
+        return json.dumps({
+            'config':{'width':__self__.width,'height':__self__.height,'max_ticks':__self__.max_ticks,
+                      'vis_radius':__self__.vis_radius,'max_gems':1,'gem_ttl':__self__.gem_ttl,
+                      'emit_signals':False,'signal_radius':1},
+            'tick':__self__.tick,
+            'bot':list(__self__.bot),
+            'wall':[list(pos) for pos in visible if pos in __self__.walls],
+            'floor':[list(pos) for pos in visible if pos not in __self__.walls],
+            'visible_bots':[],
+            'visible_gems':[{'position':list(pos),'ttl':ttl} for pos,ttl in __self__.gems.items() if pos in visible],
+            'signal_level':0,
+        })
+    def step(__self__,answer:str):
+        dx,dy = MOVES.get(answer.split(' ',1)[0].strip(),(0,0))
+        pos = (__self__.bot[0]+dx,__self__.bot[1]+dy)
+        if 0 <= pos[0] < __self__.width and 0 <= pos[1] < __self__.height and pos not in __self__.walls:
+            __self__.bot = pos
+        if __self__.gems.pop(__self__.bot,None) is not None:
+            __self__.score += 1
+        __self__.gems = {k:v-1 for k,v in __self__.gems.items() if v > 1}
+        if not __self__.gems:
+            __self__.gems[__self__.__free_field()] = __self__.gem_ttl
+        __self__.tick += 1
+    def play(__self__,command:list[str])->int:
+        '''
+            Plays the whole game against the given command, returns the score
+        '''
+        proc = subprocess.Popen(command,cwd=HERE,stdin=subprocess.PIPE,stdout=subprocess.PIPE,text=True)
+        try:
+            while __self__.tick < __self__.max_ticks:
+                proc.stdin.write(__self__.state()+'\n')
+                proc.stdin.flush()
+                answer = proc.stdout.readline()
+                if not answer:
+                    raise Exception(f'Bot stopped at tick {__self__.tick}')
+                __self__.step(answer)
+        finally:
+            proc.stdin.close()
+            proc.wait()
+        return __self__.score
+
+def run(command:list[str],games:int,parallel:int)->tuple[float,list[int]]:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        scores = list(executor.map(lambda seed: synthetic_game(seed).play(command),range(games)))
+    return time.perf_counter()-start,scores
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Games per minute benchmark for the gem bot')
+    parser.add_argument('--mode',choices=['process','server'],default='server')
+    parser.add_argument('--games',type=int,default=20)
+    parser.add_argument('--parallel',type=int,default=4,help='number of games played at the same time')
+    parser.add_argument('--workers',type=int,default=None,help='shared workers of the server')
+    args = parser.parse_args()
+    if args.mode == 'process':
+        duration,scores = run([sys.executable,'bot.py'],args.games,args.parallel)
+    else:
+        path = os.path.join(tempfile.mkdtemp(),'gem_bot.sock')
+        server_command = [sys.executable,'server.py','--serve',path]
+        if args.workers:
+            server_command += ['--workers',str(args.workers)]
+        server = subprocess.Popen(server_command,cwd=HERE)
+        try:
+            while not os.path.exists(path):
+                if server.poll() is not None:
+                    raise Exception('Server did not start')
+                time.sleep(0.05)
+            duration,scores = run([sys.executable,'server.py','--connect',path],args.games,args.parallel)
+        finally:
+            server.send_signal(signal.SIGINT)
+            server.wait()
+    print(f'{args.mode}: {args.games} games in {duration:.1f}s, {args.games/duration*60:.1f} games/min, mean score {sum(scores)/len(scores):.2f}')
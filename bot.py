@@ -48,7 +48,7 @@ class gem_bot:
     '''
         Gem Bot is a second implementation for the game hidden gems.
     '''
-    def __init__(__self__):
+    def __init__(__self__,executor=None):
         #Game Config
         __self__.visibility_range = 100
         __self__.max_gems = 0
@@ -57,6 +57,7 @@ class gem_bot:
         __self__.gem_duration = 1000
         #Base Config
         __self__.current_log_level = log_level.GAME
+        __self__.executor = executor # Shared pool (server mode), None creates a pool per plan
         __self__.decay_factor = DECAY_FACTOR
         __self__.map_max_distance = MAP_STOP_DISTANCE
         # Current State
@@ -89,7 +90,7 @@ class gem_bot:
             data = json.loads(line) #
             __self__.analyse(data)
             __self__.plan()
-            __self__.select_move()
+            print(__self__.select_move(),flush=True)
     #region analyse data
     def analyse(__self__,data):
         if __self__.first_tick:
@@ -481,8 +482,11 @@ class gem_bot:
         relevant_elements,relevant_values = __self__.__collect_targets()
         field = None
         if USE_MULTITHREADING:
-            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
-                results = list(executor.map(__self__.build_field,relevant_elements,relevant_values))
+            if __self__.executor is not None:
+                results = list(__self__.executor.map(__self__.build_field,relevant_elements,relevant_values))
+            else:
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    results = list(executor.map(__self__.build_field,relevant_elements,relevant_values))
             field = reduce(operator.add,results)
         else:
             for pos,ttl in zip (relevant_elements,relevant_values):
@@ -580,6 +584,7 @@ class gem_bot:
     def select_move(__self__)->str:
         '''
             gathers the four values around the bot, and its values. selects the field with the highest value as next move
+            returns the answer line for the runner (move and optional highlight)
         '''
         __self__.log(f'Number of target:{len(__self__.current_targets)}',log_level.INFO)
         map = __self__.field
@@ -613,7 +618,7 @@ class gem_bot:
         else:
             direction = max(directions,key=directions.get)
         highlight = __self__.hightlight_targets()
-        print(f'{direction}{highlight}',flush=True)
+        return f'{direction}{highlight}'
     # Helper
     def log(__self__,message:str,log_level_value:log_level=log_level.INFO):
         '''
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+'''
+    Server mode for the gem bot. One warm process serves many games over a Unix socket,
+    each connection is one game with its own gem_bot state.
+
+        python3 server.py --serve /tmp/gem_bot.sock     # start the warm server
+        python3 server.py --connect /tmp/gem_bot.sock   # stdin/stdout shim for the runner (replaces bot.py in start.sh)
+
+    The protocol is the one of the runner: one JSON line per tick in, one answer line per tick out.
+    The shim only uses the standard library, so it does not pay the NumPy import.
+'''
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+
+DEFAULT_SOCKET = '/tmp/gem_bot.sock'
+
+class fair_pool:
+    '''
+        Worker pool shared by all games of the server.
+        Each game gets its own queue, the workers take one task per game in turn (round robin),
+        so a game with many targets can not starve the other games.
+        Offers map() like a ThreadPoolExecutor, so it can be handed to gem_bot as executor.
+    '''
+    def __init__(__self__,max_workers:int|None=None):
+        __self__.condition = threading.Condition()
+        __self__.queues = OrderedDict() # game (calling thread) -> deque of (future,fn,args)
+        __self__.running = True
+        __self__.workers = [threading.Thread(target=__self__.__work,daemon=True) for _ in range(max_workers or os.cpu_count())]
+        for worker in __self__.workers:
+            worker.start()
+    def map(__self__,fn,*iterables)->list:
+        game = threading.get_ident()
+        futures = list()
+        with __self__.condition:
+            queue = __self__.queues.setdefault(game,deque())
+            for args in zip(*iterables):
+                future = Future()
+                queue.append((future,fn,args))
+                futures.append(future)
+            __self__.condition.notify_all()
+        return [future.result() for future in futures]
+    def shutdown(__self__):
+        with __self__.condition:
+            __self__.running = False
+            __self__.condition.notify_all()
+        for worker in __self__.workers:
+            worker.join()
+    def __next_task(__self__):
+        with __self__.condition:
+            while __self__.running and not __self__.queues:
+                __self__.condition.wait()
+            if not __self__.running:
+                return None
+            game,queue = __self__.queues.popitem(last=False)
+            task = queue.popleft()
+            if queue:
+                __self__.queues[game] = queue # Back to the end of the line
+            return task
+    def __work(__self__):
+        while (task := __self__.__next_task()) is not None:
+            future,fn,args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+def serve(path:str=DEFAULT_SOCKET,max_workers:int|None=None):
+    '''
+        Starts the server on the given Unix socket and serves games until interrupted
+    '''
+    import socketserver
+    import bot # Import here, the shim must stay free of NumPy
+
+    pool = fair_pool(max_workers)
+
+    class game_handler(socketserver.StreamRequestHandler):
+        def handle(__self__):
+            game = bot.gem_bot(executor=pool)
+            for line in __self__.rfile:
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                game.analyse(data)
+                game.plan()
+                __self__.wfile.write((game.select_move()+'\n').encode())
+                __self__.wfile.flush()
+
+    if os.path.exists(path):
+        os.remove(path)
+    socketserver.ThreadingUnixStreamServer.daemon_threads = True
+    with socketserver.ThreadingUnixStreamServer(path,game_handler) as server:
+        print(f'[INFO] Serving games on {path} with {len(pool.workers)} workers',file=sys.stderr,flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            pool.shutdown()
+            os.remove(path)
+
+def connect(path:str=DEFAULT_SOCKET):
+    '''
+        Stdin/stdout shim, forwards each tick to the server and prints the answer for the runner
+    '''
+    with socket.socket(socket.AF_UNIX,socket.SOCK_STREAM) as conn:
+        conn.connect(path)
+        answers = conn.makefile('r')
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            conn.sendall((line.rstrip('\n')+'\n').encode())
+            answer = answers.readline()
+            if not answer:
+                raise Exception('Server closed the connection')
+            print(answer.rstrip('\n'),flush=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Multi game server for the gem bot')
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--serve',metavar='SOCKET',nargs='?',const=DEFAULT_SOCKET,help='start the server on SOCKET')
+    mode.add_argument('--connect',metavar='SOCKET',nargs='?',const=DEFAULT_SOCKET,help='connect stdin/stdout to the server on SOCKET')
+    parser.add_argument('--workers',type=int,default=None,help='number of shared workers (default: cpu count)')
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.serve,args.workers)
+    else:
+        connect(args.connect)